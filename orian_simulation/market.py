@@ -1,16 +1,20 @@
 from dataclasses import dataclass
 from typing import Union, Generator
 
-from pandas import DataFrame, Timestamp
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Timestamp
 
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Asset:
     """
     A class representing a financial asset.
 
+    Assets are immutable and slotted, since they are used as dictionary keys throughout the simulation. Equality
+    is based on the asset's name only.
+
     Attributes:
         name (str): The name of the asset (e.g., "Bitcoin", "AAPL").
         allow_float_amount (bool): Indicates whether fractional amounts of the asset are allowed.
@@ -50,11 +54,14 @@ class Asset:
         return hash(self.name)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Currency:
     """
     A class representing a currency.
 
+    Currencies are immutable and slotted, since they are used as dictionary keys throughout the simulation.
+    Equality is based on the currency's name.
+
     Attributes:
         name (str): The name of the currency (e.g., "USD", "EUR").
 
@@ -102,9 +109,21 @@ class StockMarketHandler:
             containing stock market data. The DataFrame is expected to have a 'Close' column representing closing prices 
             and a DateTime index for dates.
         _dates (list[Timestamp]): A sorted list of unique dates from all the asset data in stock_market_dict.
+        _date_arr (np.ndarray): The unique dates as a raw datetime64 array, used for vectorized lookups.
+        _cursors (dict[Asset, np.ndarray]): For each asset, the number of rows available up to each date in _dates.
+        _close_arrays (dict[Asset, tuple[np.ndarray, np.ndarray]]): For each asset, its index dates and closing
+            prices as arrays, used for fast price lookups.
+        _date_index (dict[Timestamp, int]): Maps each date in _dates to its row in _price_matrix.
+        _price_matrix (np.ndarray): The closing price of every asset (columns, in stock_market_dict order) at every
+            date in _dates (rows), carrying forward the last known price. Assets without data yet are priced 0.
+            Prices are stored with the price_dtype given at initialization.
+        _days_since_price_matrix (np.ndarray): The number of whole days between every date in _dates (rows) and the
+            last available row of every asset (columns), or -1 if the asset has no data yet.
     """
 
-    def __init__(self, stock_market_dict: dict[Asset, DataFrame]):
+    def __init__(
+        self, stock_market_dict: dict[Asset, DataFrame], price_dtype: type = np.float64
+    ):
         """
         Initializes the StockMarketHandler with a dictionary of stock market data.
 
@@ -112,47 +131,168 @@ class StockMarketHandler:
             stock_market_dict (dict[Asset, DataFrame]): A dictionary where each key is an Asset and the value is 
                 a DataFrame containing stock market data for that asset. The DataFrame must have a 'Close' column 
                 and a DateTime index representing the trading dates.
+            price_dtype (type): The floating point type of the price matrix used to value wallets. Defaults to
+                np.float64, which keeps balances exact to the data; np.float32 halves its memory footprint at the
+                cost of precision.
         """
         self.stock_market_dict = stock_market_dict
-        self._dates = self._get_unique_dates()
+        dates = self._get_unique_dates()
+        self._dates = list(dates)
+        self._date_arr = dates.values
+        self._cursors = {
+            asset: np.searchsorted(df.index.values, self._date_arr, side="right")
+            for asset, df in self.stock_market_dict.items()
+        }
+        self._close_arrays = {
+            asset: (df.index.values, df["Close"].to_numpy())
+            for asset, df in self.stock_market_dict.items()
+        }
+        self._date_index = {date: i for i, date in enumerate(self._dates)}
+        self._price_matrix = np.zeros((len(self._dates), len(self._cursors)), dtype=price_dtype)
+        for column, (asset, cursors) in enumerate(self._cursors.items()):
+            self._price_matrix[:, column] = self._get_last_prices(asset, cursors)
+        self._days_since_price_matrix = np.full((len(self._dates), len(self._cursors)), -1, dtype=np.int64)
+        for column, (asset, cursors) in enumerate(self._cursors.items()):
+            self._days_since_price_matrix[:, column] = self._get_days_since_price(asset, cursors)
+
+    def _get_last_prices(self, asset: Asset, cursors: np.ndarray) -> np.ndarray:
+        """
+        Returns the last known closing price of an asset at each date in _dates.
+
+        Args:
+            asset (Asset): The asset whose prices are returned.
+            cursors (np.ndarray): The number of rows of the asset available up to each date in _dates.
+
+        Returns:
+            np.ndarray: The closing price of the last row of the asset for each date, or 0 where the asset has no
+            data yet.
+        """
+        closes = self._close_arrays[asset][1]
+        if len(closes) == 0:
+            return np.zeros(len(cursors))
+        return np.where(cursors > 0, closes[cursors - 1], 0.0)
+
+    def _get_days_since_price(self, asset: Asset, cursors: np.ndarray) -> np.ndarray:
+        """
+        Returns the number of whole days between each date in _dates and the last available row of an asset.
+
+        Args:
+            asset (Asset): The asset whose data is checked.
+            cursors (np.ndarray): The number of rows of the asset available up to each date in _dates.
+
+        Returns:
+            np.ndarray: The number of days since the last row of the asset for each date, or -1 where the asset
+            has no data yet.
+        """
+        index_values = self._close_arrays[asset][0]
+        if len(index_values) == 0:
+            return np.full(len(cursors), -1)
 
-    def _get_unique_dates(self) -> list[Timestamp]:
+        last_dates = index_values[np.maximum(cursors - 1, 0)]
+        days = (self._date_arr - last_dates) // np.timedelta64(1, "D")
+        return np.where(cursors > 0, days, -1)
+
+    def _get_unique_dates(self) -> DatetimeIndex:
         """
-        Returns a list of unique dates across all assets in the stock market data.
+        Returns the unique dates across all assets in the stock market data.
 
-        The method iterates through each asset's DataFrame to collect all unique dates and sorts them chronologically.
+        The index values of every asset's DataFrame are concatenated into a single datetime64 array, which is sorted
+        and deduplicated at once with np.unique.
 
         Returns:
-            list[Timestamp]: A sorted list of unique dates found in the stock market data.
+            DatetimeIndex: The sorted unique dates found in the stock market data, empty if there are no assets.
         """
-        dates = set()
-        for stock in self.stock_market_dict:
-            dates = dates.union(set(self.stock_market_dict[stock].index))
-        return sorted(list(dates))
+        if not self.stock_market_dict:
+            return DatetimeIndex([])
+
+        index_values = [df.index.values for df in self.stock_market_dict.values()]
+        dates = DatetimeIndex(np.unique(np.concatenate(index_values)))
 
-    def stock_market_generator(self) -> Generator[dict[Asset, DataFrame], None, None]:
+        # Index values are stored in UTC, so restore the time zone of the data if it has one
+        tz = next(iter(self.stock_market_dict.values())).index.tz
+        if tz is not None:
+            dates = dates.tz_localize("UTC").tz_convert(tz)
+        return dates
+
+    def stock_market_generator(self) -> Generator[tuple[Timestamp, int], None, None]:
         """
-        A generator that yields stock market data up to each unique date.
+        A generator that yields each unique date of the stock market data along with its position.
 
-        For each unique date, it returns the stock market data of all assets, including all data available up to that date.
+        No data is built while iterating: the stock market data of an asset up to a date is requested on demand
+        with the view method, so only the assets that are actually used get sliced.
 
         Yields:
-            tuple[Timestamp, dict[Asset, DataFrame]]: A tuple containing the date and a dictionary where the keys are 
-            the assets and the values are their corresponding DataFrames with data up to the given date.
+            tuple[Timestamp, int]: A tuple containing the date and its position in the unique dates, to be passed
+            to the view method.
+        """
+        for i, date in enumerate(self._dates):
+            yield date, i
+
+    def view(self, asset: Asset, date_position: int) -> DataFrame:
+        """
+        Returns the stock market data of an asset up to one of the unique dates.
+
+        The data is sliced by position using the precomputed cursors, so the DataFrame is a view of the original data.
+
+        Args:
+            asset (Asset): The asset whose data is returned.
+            date_position (int): The position of the date in the unique dates, as yielded by stock_market_generator.
+
+        Returns:
+            DataFrame: The stock market data of the asset, including all data available up to the date.
         """
-        for date in self._dates:
-            stock_market_dict = {
-                asset: self.stock_market_dict[asset].loc[:date]
-                for asset in self.stock_market_dict.keys()
-            }
-            yield date, stock_market_dict
+        return self.stock_market_dict[asset].iloc[: self._cursors[asset][date_position]]
+
+    def get_asset_prices(self, date: Timestamp) -> np.ndarray:
+        """
+        Returns the closing prices of all assets on one of the dates of the stock market data.
+
+        Unavailable prices are returned as 0, rather than as None, so the prices can be used directly in vectorized
+        computations such as dot products. Use get_price_availability to tell them apart from actual prices.
+
+        Args:
+            date (Timestamp): A date from the stock market data.
+
+        Returns:
+            np.ndarray: The last known closing price of each asset, in stock_market_dict order, or 0 for assets
+            without data up to the given date.
+        """
+        return self._price_matrix[self._date_index[date]]
+
+    def get_price_availability(self, date: Timestamp) -> np.ndarray:
+        """
+        Returns which assets have a price on one of the dates of the stock market data.
+
+        Args:
+            date (Timestamp): A date from the stock market data.
+
+        Returns:
+            np.ndarray: A boolean mask, in stock_market_dict order, that is False for assets without data up to the
+            given date (priced 0 by get_asset_prices).
+        """
+        return self._days_since_price_matrix[self._date_index[date]] >= 0
+
+    def get_days_since_price(self, date: Timestamp) -> np.ndarray:
+        """
+        Returns how many days old the latest data of each asset is on one of the dates of the stock market data.
+
+        Args:
+            date (Timestamp): A date from the stock market data.
+
+        Returns:
+            np.ndarray: The number of whole days since the last available row of each asset, in stock_market_dict
+            order, or -1 for assets without data up to the given date.
+        """
+        return self._days_since_price_matrix[self._date_index[date]]
 
     def get_asset_price(self, asset: Asset, date: Timestamp) -> Union[float, None]:
         """
         Returns the closing price of a given asset on a specified date.
 
-        The method checks whether the asset exists and whether the date is within the range of available data. If so, 
-        it returns the closing price for that date. If the asset or date is not found, it returns None.
+        The asset's cached arrays are fetched with a single dictionary lookup. If the date is one of the unique dates
+        of the stock market data, the position of its last closing price is read from the precomputed cursors;
+        otherwise it is located with a binary search over the asset's index. If the asset is not found or the date
+        is before its first available date, it returns None.
 
         Args:
             asset (Asset): The asset for which to retrieve the price.
@@ -162,10 +302,18 @@ class StockMarketHandler:
             Union[float, None]: The closing price of the asset on the given date, or None if the asset is not found 
             or the date is outside the range of available data.
         """
-        if (
-            date < self.stock_market_dict[asset].index[0]
-            or asset not in self.stock_market_dict
-        ):
+        close_arrays = self._close_arrays.get(asset)
+        if close_arrays is None:
+            return None
+
+        index_values, closes = close_arrays
+        date_position = self._date_index.get(date)
+        if date_position is not None:
+            position = self._cursors[asset][date_position]
+        else:
+            position = index_values.searchsorted(Timestamp(date).to_datetime64(), side="right")
+
+        if position == 0:
             return None
 
-        return self.stock_market_dict[asset].loc[:date, "Close"].iloc[-1]
\ No newline at end of file
+        return float(closes[position - 1])
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy as np
+
 from orian_simulation.simulation import WalletUpdate
 from orian_simulation.transaction import TransactionEnum
 
@@ -42,6 +44,14 @@ class Report:
         self.transaction_history = [
             update.transaction_dto.transaction_type for update in wallet_updates
         ]
+        self._balance_arr = np.fromiter(
+            self.balance_history, dtype=np.float64, count=len(self.balance_history)
+        )
+        self._transaction_arr = np.fromiter(
+            (t.value for t in self.transaction_history),
+            dtype=np.int8,
+            count=len(self.transaction_history),
+        )
 
     def generate_report(self) -> dict:
         """
@@ -60,19 +70,18 @@ class Report:
             - total_buy_transactions (int): The total number of buy transactions made.
             - total_sell_transactions (int): The total number of sell transactions made.
         """
-        initial_balance = self.balance_history[0]
-        final_balance = self.balance_history[-1]
+        initial_balance = self._balance_arr[0]
+        final_balance = self._balance_arr[-1]
         roi = (final_balance - initial_balance) / initial_balance
         net_profit = final_balance - initial_balance
-        max_profit = max(self.balance_history) - initial_balance
-        max_loss = min(self.balance_history) - initial_balance
-        total_transactions = len(self.transaction_history)
-        total_buy_transactions = sum(
-            [t == TransactionEnum.BUY for t in self.transaction_history]
-        )
-        total_sell_transactions = sum(
-            [t == TransactionEnum.SELL for t in self.transaction_history]
+        max_profit = self._balance_arr.max() - initial_balance
+        max_loss = self._balance_arr.min() - initial_balance
+        total_transactions = len(self._transaction_arr)
+        transaction_counts = np.bincount(
+            self._transaction_arr, minlength=len(TransactionEnum)
         )
+        total_buy_transactions = int(transaction_counts[TransactionEnum.BUY.value])
+        total_sell_transactions = int(transaction_counts[TransactionEnum.SELL.value])
         return {
             "roi": roi,
             "net_profit": net_profit,
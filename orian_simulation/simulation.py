@@ -1,12 +1,13 @@
 from pandas import Timestamp
 from dataclasses import dataclass
-from typing import Union
 
+import numpy as np
 import pandas as pd
 
 from orian_simulation.transaction import Wallet, TransactionDTO
 from orian_simulation.strategy import AutomatedStrategy
-from orian_simulation.market import StockMarketHandler, Asset, Currency
+from orian_simulation.market import StockMarketHandler, Asset
+from orian_simulation.trading.prediction import PredictionEnum
 
 
 @dataclass
@@ -16,12 +17,14 @@ class WalletUpdate:
 
     Attributes:
         time (Timestamp): The time of the wallet update.
-        wallet (Wallet): The wallet object representing the user's funds at that time.
+        wallet_amounts (np.ndarray): A snapshot of the wallet amounts at that time, with one entry per wallet
+            asset or currency, in the order of the simulation's wallet columns.
         transaction_dto (TransactionDTO): The transaction that triggered the wallet update.
+        balance (float): The net value of the wallet at that time.
     """
 
     time: Timestamp
-    wallet_amounts: dict[Union[Asset, Currency], float]
+    wallet_amounts: np.ndarray
     transaction_dto: TransactionDTO
     balance: float
 
@@ -54,25 +57,43 @@ class OnlineSimulation:
         self.wallet = wallet
         self.history: list[WalletUpdate] = []
         self.max_transaction_date_difference = max_transaction_date_difference
+        self._asset_index = {
+            asset: i for i, asset in enumerate(stock_market_handler.stock_market_dict)
+        }
+        self._positions = np.zeros(len(self._asset_index))
+        self._wallet_columns = {key: i for i, key in enumerate(self.wallet.amounts)}
+        # Wallet assets without stock market data have no price and add nothing to the balance
+        self._priceable_assets = tuple(
+            asset for asset in self.wallet.assets if asset in self._asset_index
+        )
+        self._base_currency = self.wallet.base_currency
 
     def run_simulation(self) -> None:
         """
         Runs the simulation by iterating over the stock market data and executing strategies.
         """
-        stock_market_dict_generator = self.stock_market_handler.stock_market_generator()
-        for current_date, stock_market_dict in stock_market_dict_generator:
-            for strategy in sorted(self.strategies, key=lambda s: s.priority):
-                stock_market_data = stock_market_dict[strategy.trading_asset]
-
-                if len(stock_market_data) == 0:
-                    continue
-
-                stock_market_date = stock_market_data.index[-1]
-                date_difference = (current_date - stock_market_date).days
-
-                if date_difference > self.max_transaction_date_difference:
+        # Pair each strategy with the stock market column of its asset, sorted by priority
+        strategy_columns = [
+            (strategy, self._asset_index[strategy.trading_asset])
+            for strategy in sorted(self.strategies, key=lambda s: s.priority)
+        ]
+        max_date_difference = self.max_transaction_date_difference
+        self._load_positions()
+
+        date_generator = self.stock_market_handler.stock_market_generator()
+        for current_date, date_position in date_generator:
+            days_since_price = self.stock_market_handler.get_days_since_price(current_date)
+
+            for strategy, column in strategy_columns:
+                date_difference = days_since_price[column]
+
+                # Skip assets without data yet or whose data is too old
+                if date_difference < 0 or date_difference > max_date_difference:
                     continue
 
+                stock_market_data = self.stock_market_handler.view(
+                    strategy.trading_asset, date_position
+                )
                 transaction = strategy.make_transaction(
                     stock_market_data,
                     wallet=self.wallet,
@@ -82,47 +103,142 @@ class OnlineSimulation:
                     continue
 
                 self.wallet.update_wallet(transaction)
+                self._update_position(transaction.asset)
                 self.history.append(
                     WalletUpdate(
                         time=current_date,
-                        wallet_amounts=self.wallet.amounts.copy(),
+                        wallet_amounts=self._get_wallet_snapshot(),
                         transaction_dto=transaction,
                         balance=self._get_wallet_balance(date=current_date),
                     )
                 )
 
-    def _get_wallet_balance(self, date) -> float:
+    def _load_positions(self) -> None:
         """
-        Returns the net value of the wallet based on the asset prices in the stock market data.
+        Loads the wallet asset amounts into the positions array, laid out in the same order as the stock market
+        prices.
+        """
+        self._positions[:] = 0.0
+        for asset in self._priceable_assets:
+            self._positions[self._asset_index[asset]] = self.wallet.get_amount(asset)
+
+    def _update_position(self, asset: Asset) -> None:
+        """
+        Updates the position of a single asset after a transaction, since the others are left unchanged.
+        """
+        self._positions[self._asset_index[asset]] = self.wallet.get_amount(asset)
+
+    def _get_wallet_snapshot(self) -> np.ndarray:
         """
-        balance = 0.0
-        for asset, amount in self.wallet.amounts.items():
-            if isinstance(asset, Currency):
-                continue
+        Returns the current wallet amounts as an array laid out in the order of the wallet columns.
+        """
+        return self.wallet.get_holdings()
 
-            asset_price = self.stock_market_handler.get_asset_price(asset, date)
-            if asset_price is not None:
-                balance += asset_price * amount
+    def _get_wallet_balance(self, date) -> float:
+        """
+        Returns the net value of the wallet based on the asset prices in the stock market data.
 
-        balance += self.wallet.amounts[self.wallet.base_currency]
+        The positions are kept up to date as transactions are made, so the value of all of them is computed
+        with a single dot product. Positions are float64, so the product is accumulated in full precision even
+        when prices are stored as float32.
+        """
+        asset_prices = self.stock_market_handler.get_asset_prices(date)
+        balance = float(asset_prices @ self._positions)
+        balance += self.wallet.get_amount(self._base_currency)
         return balance
 
     @property
     def simulation_history_dataframe(self) -> pd.DataFrame:
         """
         Returns the simulation history as a pandas DataFrame.
+
+        The DataFrame is built column by column from arrays, rather than from a list of row dictionaries.
         """
+        transactions = [update.transaction_dto for update in self.history]
+        wallet_amounts = np.array([update.wallet_amounts for update in self.history])
+        wallet_amounts = wallet_amounts.reshape(len(self.history), len(self._wallet_columns))
         history_df = pd.DataFrame(
-            [
-                {
-                    "strategy": update.transaction_dto.strategy_name,
-                    "amount": update.transaction_dto.asset_amount,
-                    "transaction_type": update.transaction_dto.transaction_type,
-                    "total_balance": update.balance,
-                    **update.wallet_amounts,
-                }
-                for update in self.history
-            ],
-            index=[update.time for update in self.history],
+            {
+                "strategy": [t.strategy_name for t in transactions],
+                "amount": np.asarray([t.asset_amount for t in transactions]),
+                "transaction_type": [t.transaction_type for t in transactions],
+                "total_balance": np.asarray([update.balance for update in self.history]),
+                **{
+                    key: wallet_amounts[:, i]
+                    for key, i in self._wallet_columns.items()
+                },
+            },
+            index=pd.DatetimeIndex([update.time for update in self.history]),
         )
         return history_df
+
+
+def run_backtest(
+    close_prices: np.ndarray,
+    predictions: np.ndarray,
+    repetitions: int,
+    buy_percentage: float,
+    sell_percentage: float,
+    cash: float,
+    asset_amount: float = 0.0,
+    allow_float_amount: bool = True,
+) -> np.ndarray:
+    """
+    Runs a backtest of a single asset traded on precomputed predictions, in one pass and without creating any
+    transaction objects.
+
+    The backtest fuses the stages of a strategy using TransactionTriggerByRepeatedPredictions and
+    TransactionQuantityManagerByWalletPercentage managers: at each price the trigger is evaluated from running
+    counts of the last predictions, the amount is computed from the current cash or asset amount, and both are
+    updated in place. It gives the same transactions as an OnlineSimulation of that strategy alone.
+
+    Args:
+        close_prices (np.ndarray): The closing prices of the asset, from oldest to newest.
+        predictions (np.ndarray): The PredictionEnum value predicted at each price, e.g. from
+            TradingAlgorithm.predict_series.
+        repetitions (int): The number of repeated predictions required to buy or sell.
+        buy_percentage (float): The percentage of the cash spent on each buy.
+        sell_percentage (float): The percentage of the asset amount sold on each sell.
+        cash (float): The initial amount of cash.
+        asset_amount (float): The initial amount of the asset.
+        allow_float_amount (bool): Whether fractional amounts of the asset can be traded.
+
+    Returns:
+        np.ndarray: The amount of the asset traded at each price: positive for buys, negative for sells and 0 when
+        no transaction is made. The asset amount over time is its cumulative sum plus the initial amount, and the
+        cash is reduced by the traded amounts times the prices.
+    """
+    increase_value = PredictionEnum.INCREASE.value
+    decrease_value = PredictionEnum.DECREASE.value
+    prediction_values = predictions.tolist()
+    traded_amounts = np.zeros(len(close_prices))
+
+    increases = decreases = 0
+    for i, (price, prediction) in enumerate(zip(close_prices.tolist(), prediction_values)):
+        # Slide the window of the last predictions, keeping running counts of increases and decreases
+        increases += prediction == increase_value
+        decreases += prediction == decrease_value
+        if i >= repetitions:
+            dropped_prediction = prediction_values[i - repetitions]
+            increases -= dropped_prediction == increase_value
+            decreases -= dropped_prediction == decrease_value
+
+        window_size = min(i + 1, repetitions)
+        if increases == window_size:
+            amount = cash * buy_percentage / price
+        elif decreases == window_size:
+            amount = -asset_amount * sell_percentage
+        else:
+            continue
+
+        if not allow_float_amount:
+            amount = int(amount)
+
+        if amount == 0:
+            continue
+
+        asset_amount += amount
+        cash -= amount * price
+        traded_amounts[i] = amount
+
+    return traded_amounts
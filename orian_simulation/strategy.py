@@ -1,3 +1,4 @@
+import numpy as np
 from pandas import DataFrame
 
 from orian_simulation.market import Asset
@@ -17,13 +18,16 @@ class AutomatedStrategy:
     Class representing an automated trading strategy.
 
     Attributes:
-    - trading_algorithm (TradingAlgorithm): The trading algorithm used by the strategy.
+    - trading_algorithm (TradingAlgorithm): The trading algorithm used by the strategy. It is read-only.
     - trading_asset (Asset): The asset being traded by the strategy.
     - priority (int): The priority of the strategy (lower values are executed first).
-    - transaction_trigger (TransactionTrigger): The trigger for executing transactions.
+    - transaction_trigger (TransactionTrigger): The trigger for executing transactions. It is read-only.
     - buy_transaction_quantity_manager (TransactionQuantityManager): The quantity manager for buy transactions.
     - sell_transaction_quantity_manager (TransactionQuantityManager): The quantity manager for sell transactions.
-    - predictions (list[PredictionEnum]): A list of predictions made by the trading algorithm.
+    - predictions (list[PredictionEnum]): A list of the latest predictions made by the trading algorithm.
+        Internally, the predictions are stored as an int8 array of PredictionEnum values, which is what the
+        transaction trigger evaluates. If the trigger has a history_size, older predictions are discarded so the
+        array stays bounded; at least history_size predictions are always kept.
     - name (str): The name of the strategy (optional).
 
     Methods:
@@ -42,15 +46,71 @@ class AutomatedStrategy:
         sell_transaction_quantity_manager: TransactionQuantityManager,
         name: str = None,
     ):
-        self.trading_algorithm = trading_algorithm
+        self._trading_algorithm = trading_algorithm
         default_name = f"{trading_algorithm.name}({trading_asset.name})"
         self.name = name or default_name
         self.trading_asset = trading_asset
         self.priority = priority
-        self.transaction_trigger = transaction_trigger
+        self._transaction_trigger = transaction_trigger
         self.buy_transaction_quantity_manager = buy_transaction_quantity_manager
         self.sell_transaction_quantity_manager = sell_transaction_quantity_manager
-        self.predictions: list[PredictionEnum] = []
+        self._predictions = np.empty(64, dtype=np.int8)
+        self._n_predictions = 0
+
+        # Bind the methods called on every tick once, skipping their lookup in make_transaction. The algorithm
+        # and trigger are read-only properties, so the bound methods cannot go stale. Algorithms that do not
+        # override make_prediction_from_array may use more than the closing prices, so they get the full data.
+        self._predicts_from_array = (
+            type(trading_algorithm).make_prediction_from_array
+            is not TradingAlgorithm.make_prediction_from_array
+        )
+        if self._predicts_from_array:
+            self._predict = trading_algorithm.make_prediction_from_array
+        else:
+            self._predict = trading_algorithm.make_prediction
+        self._evaluate_predictions = transaction_trigger.evaluate_predictions
+
+    @property
+    def trading_algorithm(self) -> TradingAlgorithm:
+        """
+        Returns the trading algorithm used by the strategy.
+        """
+        return self._trading_algorithm
+
+    @property
+    def transaction_trigger(self) -> TransactionTrigger:
+        """
+        Returns the trigger for executing transactions.
+        """
+        return self._transaction_trigger
+
+    @property
+    def predictions(self) -> list[PredictionEnum]:
+        """
+        Returns the latest predictions made by the trading algorithm, oldest first.
+        """
+        return [PredictionEnum(p) for p in self._predictions[: self._n_predictions]]
+
+    def _add_prediction(self, prediction: PredictionEnum) -> None:
+        """
+        Stores a prediction value in the predictions array.
+
+        When the array is full, the predictions needed by the transaction trigger are moved to its start if they
+        fit in half of it, so the array works as a bounded history; otherwise its capacity is doubled.
+        """
+        if self._n_predictions == len(self._predictions):
+            history_size = self._transaction_trigger.history_size
+            if history_size is not None and 2 * history_size <= len(self._predictions):
+                kept = self._predictions[self._n_predictions - history_size :].copy()
+                self._predictions[:history_size] = kept
+                self._n_predictions = history_size
+            else:
+                self._predictions = np.concatenate(
+                    (self._predictions, np.empty_like(self._predictions))
+                )
+
+        self._predictions[self._n_predictions] = prediction.value
+        self._n_predictions += 1
 
     def make_transaction(
         self, stock_market_data: DataFrame, wallet: Wallet
@@ -63,13 +123,17 @@ class AutomatedStrategy:
         Returns:
             TransactionDTO: The transaction data transfer object representing the transaction.
         """
-        # Get prediction from trading algorithm
-        prediction = self.trading_algorithm.make_prediction(stock_market_data)
-        self.predictions.append(prediction)
+        # Get prediction from trading algorithm, extracting the closing prices only once
+        close_prices = stock_market_data["Close"].to_numpy()
+        if self._predicts_from_array:
+            prediction = self._predict(close_prices)
+        else:
+            prediction = self._predict(stock_market_data)
+        self._add_prediction(prediction)
 
         # Evaluate predictions and trigger transaction
-        transaction_type = self.transaction_trigger.evaluate_predictions(
-            self.predictions
+        transaction_type = self._evaluate_predictions(
+            self._predictions[: self._n_predictions]
         )
 
         if transaction_type is TransactionEnum.HOLD:
@@ -79,7 +143,7 @@ class AutomatedStrategy:
             transaction_type=transaction_type,
             currency=wallet.base_currency,
             asset=self.trading_asset,
-            asset_price=stock_market_data["Close"].iloc[-1],
+            asset_price=close_prices[-1],
             transaction_date=stock_market_data.index[-1],
             asset_amount=None,
             strategy_name=self.name,
@@ -1,11 +1,76 @@
-from random import choice
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from orian_simulation.trading.prediction import PredictionEnum
 
 
+# Up to this many prices, a single scalar pass over Python floats is faster than the fixed cost of NumPy calls
+_SCALAR_WINDOW_LIMIT = 64
+
+
+def _count_price_moves(prices: np.ndarray) -> tuple[int, int]:
+    """
+    Counts the consecutive price increases and decreases within an array of closing prices.
+
+    Each price is compared with the next one in a single pass: a scalar loop for small windows, where the overhead
+    of NumPy calls dominates, or vectorized comparisons for larger ones.
+
+    Args:
+        prices (np.ndarray): The closing prices to analyze.
+
+    Returns:
+        tuple[int, int]: The number of price increases and the number of price decreases.
+    """
+    if len(prices) <= _SCALAR_WINDOW_LIMIT:
+        values = prices.tolist()
+        increases = decreases = 0
+        for previous, current in zip(values, values[1:]):
+            if previous < current:
+                increases += 1
+            elif previous > current:
+                decreases += 1
+        return increases, decreases
+
+    price_changes = np.diff(prices)
+    increases = np.count_nonzero(price_changes > 0)
+    decreases = np.count_nonzero(price_changes < 0)
+    return int(increases), int(decreases)
+
+
+def _get_steady_direction(prices: np.ndarray) -> int:
+    """
+    Returns the direction shared by every consecutive price movement within an array of closing prices.
+
+    For small windows the prices are scanned as Python floats, stopping at the first movement that breaks the
+    trend; larger windows compare the signs of the price changes against the first one in a vectorized pass.
+
+    Args:
+        prices (np.ndarray): The closing prices to analyze.
+
+    Returns:
+        int: 1 if every price increases, -1 if every price decreases, or 0 otherwise.
+    """
+    if len(prices) < 2:
+        return 1
+
+    if len(prices) <= _SCALAR_WINDOW_LIMIT:
+        values = prices.tolist()
+        direction = 1 if values[0] < values[1] else -1
+        for previous, current in zip(values, values[1:]):
+            if not (previous < current if direction > 0 else previous > current):
+                return 0
+        return direction
+
+    signs = np.sign(np.diff(prices))
+    direction = signs[0]
+    if direction != 0 and np.all(signs == direction):
+        return int(direction)
+    return 0
+
+
 class TradingAlgorithm(ABC):
     def __init__(self):
         self.window_sizeame = "TradingAlgorithm"
@@ -14,6 +79,45 @@ class TradingAlgorithm(ABC):
     def make_prediction(self, stock_market_data: pd.DataFrame) -> PredictionEnum:
         pass
 
+    def make_prediction_from_array(self, close_prices: np.ndarray) -> PredictionEnum:
+        """
+        Makes a prediction from an array of closing prices, skipping the DataFrame column lookup.
+
+        Algorithms that only need closing prices should override it, and the simulation then uses it instead of
+        make_prediction. By default it wraps the closing prices in a DataFrame with a 'Close' column and calls
+        make_prediction, so the simulation keeps passing the full stock market data to algorithms that do not
+        override it.
+
+        Args:
+            close_prices (np.ndarray): The closing prices available so far, from oldest to newest.
+
+        Returns:
+            PredictionEnum: The predicted trend of the stock.
+        """
+        return self.make_prediction(pd.DataFrame({"Close": close_prices}))
+
+    def predict_series(self, close_prices: np.ndarray) -> np.ndarray:
+        """
+        Makes the prediction for every point of a series of closing prices at once.
+
+        By default this calls make_prediction_from_array on each prefix of the series; algorithms that can compute
+        all predictions in bulk should override it.
+
+        Args:
+            close_prices (np.ndarray): The closing prices, from oldest to newest.
+
+        Returns:
+            np.ndarray: An int8 array with the value of the PredictionEnum predicted with the prices available up
+            to each point of the series.
+        """
+        return np.array(
+            [
+                self.make_prediction_from_array(close_prices[: i + 1]).value
+                for i in range(len(close_prices))
+            ],
+            dtype=np.int8,
+        )
+
 
 class SteadyTrendAlgorithm(TradingAlgorithm):
     """
@@ -38,12 +142,19 @@ class SteadyTrendAlgorithm(TradingAlgorithm):
     Methods:
         make_prediction(stock_market_data: pd.DataFrame) -> PredictionEnum:
             Analyzes the recent stock market data and predicts the trend based on the closing prices within the window.
+        make_prediction_from_array(close_prices: np.ndarray) -> PredictionEnum:
+            Same as make_prediction, taking the closing prices as an array.
+        predict_series(close_prices: np.ndarray) -> np.ndarray:
+            Makes the prediction for every point of a series of closing prices at once.
     """
 
     def __init__(self, window_size: int):
         self.window_size = window_size
         self.name = f"SteadyTrendAlgorithm({window_size})"
 
+        # The window is fixed, so its slice is computed once
+        self._window = slice(-window_size, None)
+
     def make_prediction(self, stock_market_data: pd.DataFrame) -> PredictionEnum:
         """
         Analyzes the stock market data and predicts the trend based on consecutive price movements.
@@ -58,22 +169,57 @@ class SteadyTrendAlgorithm(TradingAlgorithm):
                 - STABLE: If the prices do not show a consistent trend.
                 - UNKNOWN: If there are insufficient data points to fill the window size.
         """
-        if len(stock_market_data) < self.window_size:
+        return self.make_prediction_from_array(stock_market_data["Close"].to_numpy())
+
+    def make_prediction_from_array(self, close_prices: np.ndarray) -> PredictionEnum:
+        """
+        Predicts the trend based on consecutive price movements within the last closing prices.
+
+        Args:
+            close_prices (np.ndarray): The closing prices available so far, from oldest to newest.
+
+        Returns:
+            PredictionEnum: The predicted trend of the stock, as described in make_prediction.
+        """
+        if len(close_prices) < self.window_size:
             return PredictionEnum.UNKNOWN
 
-        prices = stock_market_data["Close"].iloc[-self.window_size :]
+        direction = _get_steady_direction(close_prices[self._window])
 
-        if all(
-            prices.iloc[i] < prices.iloc[i + 1] for i in range(self.window_size - 1)
-        ):
+        if direction > 0:
             return PredictionEnum.INCREASE
-        elif all(
-            prices.iloc[i] > prices.iloc[i + 1] for i in range(self.window_size - 1)
-        ):
+        elif direction < 0:
             return PredictionEnum.DECREASE
         else:
             return PredictionEnum.STABLE
 
+    def predict_series(self, close_prices: np.ndarray) -> np.ndarray:
+        """
+        Makes the prediction for every point of a series of closing prices at once.
+
+        The signs of all price changes are computed once, and every window of them is checked through a
+        sliding window view, without copying the data.
+
+        Args:
+            close_prices (np.ndarray): The closing prices, from oldest to newest.
+
+        Returns:
+            np.ndarray: An int8 array with the value of the PredictionEnum predicted with the prices available up
+            to each point of the series.
+        """
+        predictions = np.full(len(close_prices), PredictionEnum.UNKNOWN.value, dtype=np.int8)
+        if len(close_prices) < self.window_size:
+            return predictions
+
+        signs = np.sign(np.diff(close_prices))
+        windows = sliding_window_view(signs, self.window_size - 1)
+        window_predictions = predictions[self.window_size - 1 :]
+        window_predictions[:] = PredictionEnum.STABLE.value
+        window_predictions[np.all(windows < 0, axis=1)] = PredictionEnum.DECREASE.value
+        # Increases are set last so empty windows (window_size 1) are increasing, as in make_prediction
+        window_predictions[np.all(windows > 0, axis=1)] = PredictionEnum.INCREASE.value
+        return predictions
+
 
 class MajorityTrendAlgorithm(TradingAlgorithm):
     """
@@ -93,6 +239,10 @@ class MajorityTrendAlgorithm(TradingAlgorithm):
     Methods:
         make_prediction(stock_market_data: pd.DataFrame) -> PredictionEnum:
             Analyzes the stock market data and predicts the dominant trend based on the given window of prices.
+        make_prediction_from_array(close_prices: np.ndarray) -> PredictionEnum:
+            Same as make_prediction, taking the closing prices as an array.
+        predict_series(close_prices: np.ndarray) -> np.ndarray:
+            Makes the prediction for every point of a series of closing prices at once.
     """
 
     def __init__(self, window_size: int):
@@ -105,6 +255,9 @@ class MajorityTrendAlgorithm(TradingAlgorithm):
         self.window_size = window_size
         self.name = f"MajorityTrendAlgorithm({window_size})"
 
+        # The window is fixed, so its slice is computed once
+        self._window = slice(-window_size, None)
+
     def make_prediction(self, stock_market_data: pd.DataFrame) -> PredictionEnum:
         """
         Analyzes the stock market data and predicts the dominant trend of a stock based on recent closing prices.
@@ -119,20 +272,27 @@ class MajorityTrendAlgorithm(TradingAlgorithm):
                 - STABLE: if the price movements are balanced or unclear.
                 - UNKNOWN: if there is insufficient data to analyze.
         """
+        return self.make_prediction_from_array(stock_market_data["Close"].to_numpy())
+
+    def make_prediction_from_array(self, close_prices: np.ndarray) -> PredictionEnum:
+        """
+        Predicts the dominant trend of a stock based on the last closing prices.
+
+        Args:
+            close_prices (np.ndarray): The closing prices available so far, from oldest to newest.
+
+        Returns:
+            PredictionEnum: The predicted trend of the stock, as described in make_prediction.
+        """
         # Check if there is enough data for the specified window size
-        if len(stock_market_data) < self.window_size:
+        if len(close_prices) < self.window_size:
             return PredictionEnum.UNKNOWN
 
         # Extract the closing prices for the analysis window
-        prices = stock_market_data["Close"].iloc[-self.window_size :]
+        prices = close_prices[self._window]
 
         # Count the number of price increases and decreases
-        increases = sum(
-            prices.iloc[i] < prices.iloc[i + 1] for i in range(self.window_size - 1)
-        )
-        decreases = sum(
-            prices.iloc[i] > prices.iloc[i + 1] for i in range(self.window_size - 1)
-        )
+        increases, decreases = _count_price_moves(prices)
 
         # Make a prediction based on the majority of movements
         if increases > decreases:
@@ -142,6 +302,39 @@ class MajorityTrendAlgorithm(TradingAlgorithm):
         else:
             return PredictionEnum.STABLE
 
+    def predict_series(self, close_prices: np.ndarray) -> np.ndarray:
+        """
+        Makes the prediction for every point of a series of closing prices at once.
+
+        The increases and decreases of every window are obtained by subtracting prefix sums of the price movements,
+        so each prediction takes constant time regardless of the window size.
+
+        Args:
+            close_prices (np.ndarray): The closing prices, from oldest to newest.
+
+        Returns:
+            np.ndarray: An int8 array with the value of the PredictionEnum predicted with the prices available up
+            to each point of the series.
+        """
+        predictions = np.full(len(close_prices), PredictionEnum.UNKNOWN.value, dtype=np.int8)
+        if len(close_prices) < self.window_size:
+            return predictions
+
+        # Running counts of increases and decreases, starting at 0 before the first price
+        price_changes = np.diff(close_prices)
+        increase_sums = np.concatenate(([0], np.cumsum(price_changes > 0)))
+        decrease_sums = np.concatenate(([0], np.cumsum(price_changes < 0)))
+
+        window_moves = self.window_size - 1
+        increases = increase_sums[window_moves:] - increase_sums[: len(increase_sums) - window_moves]
+        decreases = decrease_sums[window_moves:] - decrease_sums[: len(decrease_sums) - window_moves]
+
+        window_predictions = predictions[self.window_size - 1 :]
+        window_predictions[:] = PredictionEnum.STABLE.value
+        window_predictions[increases > decreases] = PredictionEnum.INCREASE.value
+        window_predictions[decreases > increases] = PredictionEnum.DECREASE.value
+        return predictions
+
 
 class RandomAlgorithm(TradingAlgorithm):
     """
@@ -149,14 +342,36 @@ class RandomAlgorithm(TradingAlgorithm):
 
     This algorithm randomly predicts whether the stock price will increase, decrease, or remain stable. It is used as a baseline for comparison with other trading algorithms.
 
+    Args:
+        seed (int): The seed of the random number generator, used to make the predictions reproducible. If None,
+            the generator is seeded from the operating system.
+
     Methods:
         make_prediction(stock_market_data: pd.DataFrame) -> PredictionEnum:
             Makes a random prediction of the stock price trend.
+        make_prediction_from_array(close_prices: np.ndarray) -> PredictionEnum:
+            Same as make_prediction, taking the closing prices as an array.
     """
 
-    def __init__(self):
+    _BATCH_SIZE = 65536
+    _CHOICES = (PredictionEnum.INCREASE, PredictionEnum.DECREASE, PredictionEnum.STABLE)
+
+    def __init__(self, seed: int = None):
         self.name = "RandomAlgorithm"
 
+        # Random choices are drawn in batches to amortize the cost of the random number generator
+        self._rng = np.random.default_rng(seed)
+        self._draws = self._draw_batch()
+        self._draw_index = 0
+
+    def _draw_batch(self) -> np.ndarray:
+        """
+        Draws a batch of random indices into the possible predictions.
+        """
+        return self._rng.integers(
+            0, len(self._CHOICES), size=self._BATCH_SIZE, dtype=np.int8
+        )
+
     def make_prediction(self, stock_market_data: pd.DataFrame) -> PredictionEnum:
         """
         Makes a random prediction of the stock price trend.
@@ -167,6 +382,22 @@ class RandomAlgorithm(TradingAlgorithm):
         Returns:
             PredictionEnum: A random prediction of the stock price trend.
         """
-        return choice(
-            [PredictionEnum.INCREASE, PredictionEnum.DECREASE, PredictionEnum.STABLE]
-        )
+        return self.make_prediction_from_array(None)
+
+    def make_prediction_from_array(self, close_prices: np.ndarray) -> PredictionEnum:
+        """
+        Makes a random prediction of the stock price trend.
+
+        Args:
+            close_prices (np.ndarray): The closing prices available so far, which are ignored.
+
+        Returns:
+            PredictionEnum: A random prediction of the stock price trend.
+        """
+        if self._draw_index == len(self._draws):
+            self._draws = self._draw_batch()
+            self._draw_index = 0
+
+        prediction = self._CHOICES[self._draws[self._draw_index]]
+        self._draw_index += 1
+        return prediction
@@ -2,7 +2,10 @@ from enum import Enum
 from abc import ABC, abstractmethod
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Union
+from types import MappingProxyType
+from typing import Mapping, Union
+
+import numpy as np
 
 from orian_simulation.trading.prediction import PredictionEnum
 from orian_simulation.market import Asset, Currency
@@ -18,10 +21,11 @@ class TransactionEnum(Enum):
     HOLD = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionDTO:
     """
-    Data Transfer Object representing a financial transaction.
+    Data Transfer Object representing a financial transaction. It uses slots, since one is created for every
+    transaction of a simulation.
 
     Attributes:
     - transaction_type (TransactionEnum): The type of transaction (BUY, SELL, HOLD).
@@ -42,33 +46,137 @@ class TransactionDTO:
     strategy_name: str
 
 
-@dataclass
 class Wallet:
     """
     Represents a wallet containing various assets and a base currency.
 
+    The amounts are stored in a float64 array with one slot per asset or currency, indexed through a mapping that
+    is fixed when the wallet is created, so transactions update array slots instead of dictionary entries.
+
     Attributes:
-    - amounts (dict[Asset or Currency, float]): A dictionary holding the amount of each asset and currency \
-        in the wallet.
+    - amounts (Mapping[Asset or Currency, float]): A read-only mapping holding the amount of each asset and \
+        currency in the wallet. It is built from the wallet array on access, so writing to it raises a TypeError; \
+        use set_amount instead.
     - base_currency (Currency): The base currency for the wallet.
+    - assets (list[Asset]): The assets held in the wallet.
 
     Methods:
+    - get_amount(key: Asset or Currency) -> float:
+        Returns the amount of an asset or currency in the wallet.
+    - set_amount(key: Asset or Currency, amount: float) -> None:
+        Sets the amount of an asset or currency in the wallet.
+    - get_holdings() -> np.ndarray:
+        Returns a copy of the wallet array, in the order of the amounts dictionary.
+    - get_index(key: Asset or Currency) -> int:
+        Returns the position of an asset or currency in the wallet array.
     - update_wallet(transaction_dto: TransactionDTO) -> None:
         Updates the wallet based on a transaction.
+    - apply_transactions(transaction_types, asset_indices, asset_prices, asset_amounts) -> None:
+        Updates the wallet based on a batch of transactions given as arrays.
     """
 
-    amounts: dict[Union[Asset, Currency], float]
-    base_currency: Currency
+    __slots__ = ("base_currency", "_keys", "_index", "_holdings", "_base_index", "_asset_indices")
+
+    def __init__(
+        self, amounts: dict[Union[Asset, Currency], float], base_currency: Currency
+    ):
+        self.base_currency = base_currency
 
-    def __post_init__(self):
         # Initialize the base currency amount to 0 if not present
-        if not self.base_currency in self.amounts.keys():
-            self.amounts[self.base_currency] = 0
+        keys = list(amounts.keys())
+        if base_currency not in amounts:
+            keys.append(base_currency)
+
+        self._keys = tuple(keys)
+        self._index = {key: i for i, key in enumerate(keys)}
+        self._holdings = np.fromiter(
+            (amounts.get(key, 0) for key in keys), dtype=np.float64, count=len(keys)
+        )
+        self._base_index = self._index[base_currency]
+
+        # Find the positions of the assets once, so the assets list is not rescanned on access
+        self._asset_indices = tuple(i for i, key in enumerate(keys) if isinstance(key, Asset))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares this wallet to another wallet, based on their base currency and amounts.
+
+        Parameters:
+        - other (Wallet): The other wallet to compare with.
+
+        Returns:
+        - bool: True if both wallets have the same base currency and hold the same amounts, False otherwise.
+        """
+        if not isinstance(other, Wallet):
+            return NotImplemented
+        return self.base_currency == other.base_currency and dict(self.amounts) == dict(other.amounts)
+
+    def __repr__(self) -> str:
+        return f"Wallet(amounts={dict(self.amounts)!r}, base_currency={self.base_currency!r})"
+
+    @property
+    def amounts(self) -> Mapping[Union[Asset, Currency], float]:
+        """
+        Returns a read-only snapshot of the amount of each asset and currency in the wallet.
+        """
+        return MappingProxyType(dict(zip(self._keys, self._holdings.tolist())))
+
+    @property
+    def assets(self) -> list[Asset]:
+        """
+        Returns the assets held in the wallet.
+        """
+        return [self._keys[i] for i in self._asset_indices]
+
+    def get_amount(self, key: Union[Asset, Currency]) -> float:
+        """
+        Returns the amount of an asset or currency in the wallet.
+
+        Parameters:
+        - key (Asset or Currency): The asset or currency to look up.
+
+        Returns:
+        - float: The amount held in the wallet.
+        """
+        return float(self._holdings[self._index[key]])
+
+    def set_amount(self, key: Union[Asset, Currency], amount: float) -> None:
+        """
+        Sets the amount of an asset or currency in the wallet.
+
+        Parameters:
+        - key (Asset or Currency): The asset or currency to update.
+        - amount (float): The new amount held in the wallet.
+
+        Raises:
+        - ValueError: If the asset or currency is not available in the wallet.
+        """
+        index = self._index.get(key)
+        if index is None:
+            raise ValueError(f"'{key}' is not available in wallet")
+
+        self._holdings[index] = amount
 
-        # Initialize the assets list
-        self.assets = [
-            asset for asset in self.amounts.keys() if isinstance(asset, Asset)
-        ]
+    def get_holdings(self) -> np.ndarray:
+        """
+        Returns a copy of the amounts held in the wallet, in the order of the amounts dictionary.
+
+        Returns:
+        - np.ndarray: A float64 array with one amount per asset or currency.
+        """
+        return self._holdings.copy()
+
+    def get_index(self, key: Union[Asset, Currency]) -> int:
+        """
+        Returns the position of an asset or currency in the wallet array.
+
+        Parameters:
+        - key (Asset or Currency): The asset or currency to look up.
+
+        Returns:
+        - int: The position of the key, as used by get_holdings and apply_transactions.
+        """
+        return self._index[key]
 
     def update_wallet(self, transaction_dto: TransactionDTO) -> None:
         """
@@ -80,36 +188,70 @@ class Wallet:
         Raises:
         - ValueError: If the asset involved in the transaction is not available in the wallet.
         """
-        if not transaction_dto.asset in self.amounts.keys():
+        asset_index = self._index.get(transaction_dto.asset)
+        if asset_index is None:
             raise ValueError(
                 f"Asset '{transaction_dto.asset}' is not available in wallet"
             )
 
         currency_amount = transaction_dto.asset_amount * transaction_dto.asset_price
 
-        if transaction_dto.transaction_type == TransactionEnum.SELL:
-            self.amounts[transaction_dto.asset] -= transaction_dto.asset_amount
-            self.amounts[self.base_currency] += currency_amount
+        if transaction_dto.transaction_type is TransactionEnum.SELL:
+            self._holdings[asset_index] -= transaction_dto.asset_amount
+            self._holdings[self._base_index] += currency_amount
+
+        elif transaction_dto.transaction_type is TransactionEnum.BUY:
+            self._holdings[asset_index] += transaction_dto.asset_amount
+            self._holdings[self._base_index] -= currency_amount
+
+    def apply_transactions(
+        self,
+        transaction_types: np.ndarray,
+        asset_indices: np.ndarray,
+        asset_prices: np.ndarray,
+        asset_amounts: np.ndarray,
+    ) -> None:
+        """
+        Updates the wallet based on a batch of transactions, with the same effect as calling update_wallet on each
+        of them.
 
-        elif transaction_dto.transaction_type == TransactionEnum.BUY:
-            self.amounts[transaction_dto.asset] += transaction_dto.asset_amount
-            self.amounts[self.base_currency] -= currency_amount
+        Each transaction is described by the entries at the same position of the given arrays. Buys and sells are
+        turned into signed asset amounts, which are accumulated into the wallet array in a single np.add.at call,
+        and the base currency is settled with a single dot product. Other transaction types are ignored.
+
+        Parameters:
+        - transaction_types (np.ndarray): The TransactionEnum values of the transactions.
+        - asset_indices (np.ndarray): The wallet positions of the transacted assets, as returned by get_index.
+        - asset_prices (np.ndarray): The prices of the assets at the time of the transactions.
+        - asset_amounts (np.ndarray): The amounts of the assets being transacted.
+        """
+        buys = transaction_types == TransactionEnum.BUY.value
+        sells = transaction_types == TransactionEnum.SELL.value
+        signed_amounts = np.where(buys, asset_amounts, 0.0) - np.where(sells, asset_amounts, 0.0)
+
+        np.add.at(self._holdings, asset_indices, signed_amounts)
+        self._holdings[self._base_index] -= np.dot(signed_amounts, asset_prices)
 
 
 class TransactionTrigger(ABC):
     """
     Abstract base class for evaluating transaction triggers based on prediction history.
+
+    Attributes:
+    - history_size (int): The number of most recent predictions the trigger needs to evaluate the prediction \
+        history, or None if it needs all of them. Strategies discard older predictions to bound their memory.
     """
 
+    history_size: int = None
+
     @abstractmethod
-    def evaluate_predictions(
-        self, prediction_dto_history: list[PredictionEnum]
-    ) -> TransactionEnum:
+    def evaluate_predictions(self, prediction_history: np.ndarray) -> TransactionEnum:
         """
         Evaluates the prediction history and determines the type of transaction to be made.
 
         Parameters:
-        - prediction_dto_history (list[PredictionEnum]): A list of prediction data transfer objects.
+        - prediction_history (np.ndarray): An int8 array with the values of the PredictionEnum predictions made so \
+            far, from oldest to newest.
 
         Returns:
         - TransactionEnum: The type of transaction determined based on the predictions.
@@ -146,33 +288,39 @@ class TransactionTriggerByRepeatedPredictions(TransactionTrigger):
 
     Attributes:
     - repetitions (int): The number of repeated predictions to consider for triggering a transaction.
+    - history_size (int): The number of most recent predictions needed, equal to repetitions.
 
     Methods:
-    - evaluate_predictions(prediction_dto_history: list[PredictionEnum]) -> TransactionEnum:
+    - evaluate_predictions(prediction_history: np.ndarray) -> TransactionEnum:
         Evaluates the prediction history and triggers a transaction if conditions are met.
     """
 
     def __init__(self, repetitions: int):
         self.repetitions = repetitions
+        self.history_size = repetitions
 
-    def evaluate_predictions(
-        self, prediction_dto_history: list[PredictionEnum]
-    ) -> TransactionEnum:
+        # Byte patterns of repeated predictions, compared against the raw int8 history in a single memcmp
+        self._increase_pattern = bytes([PredictionEnum.INCREASE.value]) * repetitions
+        self._decrease_pattern = bytes([PredictionEnum.DECREASE.value]) * repetitions
+
+    def evaluate_predictions(self, prediction_history: np.ndarray) -> TransactionEnum:
         """
         Evaluates the prediction history and determines the transaction type based on repeated predictions.
 
         Parameters:
-        - prediction_dto_history (list[PredictionEnum]): A list of prediction data transfer objects.
+        - prediction_history (np.ndarray): An int8 array with the values of the PredictionEnum predictions made so \
+            far, from oldest to newest.
 
         Returns:
         - TransactionEnum: The type of transaction determined based on the repeated predictions.
         """
-        last_predictions = prediction_dto_history[-self.repetitions :]
+        last_predictions = prediction_history[-self.repetitions :].tobytes()
+        n_predictions = len(last_predictions)
 
-        if all([p == PredictionEnum.INCREASE for p in last_predictions]):
+        if last_predictions == self._increase_pattern[:n_predictions]:
             return TransactionEnum.BUY
 
-        elif all([p == PredictionEnum.DECREASE for p in last_predictions]):
+        elif last_predictions == self._decrease_pattern[:n_predictions]:
             return TransactionEnum.SELL
 
         return TransactionEnum.HOLD
@@ -195,6 +343,30 @@ class TransactionQuantityManagerByWalletPercentage(TransactionQuantityManager):
         self.wallet = wallet
         self.percentage = percentage
 
+        # Amount functions indexed by TransactionEnum value, so transaction types are dispatched with a single lookup
+        self._amount_functions = (self._sell_amount, self._buy_amount, self._hold_amount)
+
+    def _sell_amount(self, transaction_dto: TransactionDTO) -> float:
+        """
+        Returns the amount of the asset to sell.
+        """
+        wallet_asset_amount = self.wallet.get_amount(transaction_dto.asset)
+        return wallet_asset_amount * self.percentage
+
+    def _buy_amount(self, transaction_dto: TransactionDTO) -> float:
+        """
+        Returns the amount of the asset to buy.
+        """
+        currency_amount = self.wallet.get_amount(self.wallet.base_currency)
+        currency_amount *= self.percentage
+        return currency_amount / transaction_dto.asset_price
+
+    def _hold_amount(self, transaction_dto: TransactionDTO) -> float:
+        """
+        Returns the amount of the asset to transact when holding, which is always 0.
+        """
+        return 0
+
     def compute_asset_amount(self, transaction_dto: TransactionDTO) -> TransactionDTO:
         """
         Computes the amount of the asset to be transacted based on the wallet's holdings and the specified percentage.
@@ -206,17 +378,8 @@ class TransactionQuantityManagerByWalletPercentage(TransactionQuantityManager):
         - TransactionDTO: The transaction DTO with updated asset amount.
         """
         # Compute asset amount based on transaction type
-        if transaction_dto.transaction_type == TransactionEnum.BUY:
-            currency_amount = self.wallet.amounts[self.wallet.base_currency]
-            currency_amount *= self.percentage
-            asset_amount = currency_amount / transaction_dto.asset_price
-
-        elif transaction_dto.transaction_type == TransactionEnum.SELL:
-            wallet_asset_amount = self.wallet.amounts[transaction_dto.asset]
-            asset_amount = wallet_asset_amount * self.percentage
-
-        else:
-            asset_amount = 0
+        amount_function = self._amount_functions[transaction_dto.transaction_type.value]
+        asset_amount = amount_function(transaction_dto)
 
         # Convert to integer if asset does not allow float amounts
         if not transaction_dto.asset.allow_float_amount:
@@ -246,6 +409,33 @@ class TransactionQuantityManagerByFixedAmount(TransactionQuantityManager):
         self.wallet = wallet
         self.fixed_amount = fixed_amount
 
+        # The whole amount used for assets that do not allow float amounts is computed once
+        self._whole_fixed_amount = int(fixed_amount)
+
+        # Amount functions indexed by TransactionEnum value, so transaction types are dispatched with a single lookup
+        self._amount_functions = (self._sell_amount, self._buy_amount, self._hold_amount)
+
+    def _sell_amount(self, transaction_dto: TransactionDTO, fixed_amount: float) -> float:
+        """
+        Returns the amount of the asset to sell.
+        """
+        wallet_asset_amount = self.wallet.get_amount(transaction_dto.asset)
+        return min(wallet_asset_amount, fixed_amount)
+
+    def _buy_amount(self, transaction_dto: TransactionDTO, fixed_amount: float) -> float:
+        """
+        Returns the amount of the asset to buy.
+        """
+        wallet_currency_amount = self.wallet.get_amount(self.wallet.base_currency)
+        currency_amount = min(wallet_currency_amount, fixed_amount)
+        return currency_amount / transaction_dto.asset_price
+
+    def _hold_amount(self, transaction_dto: TransactionDTO, fixed_amount: float) -> float:
+        """
+        Returns the amount of the asset to transact when holding, which is always 0.
+        """
+        return 0
+
     def compute_asset_amount(self, transaction_dto: TransactionDTO) -> TransactionDTO:
         """
         Computes the amount of the asset to be transacted based on the fixed amounts for buying and selling.
@@ -256,24 +446,15 @@ class TransactionQuantityManagerByFixedAmount(TransactionQuantityManager):
         Returns:
         - TransactionDTO: The transaction DTO with updated asset amount.
         """
-        # Convert to integer if asset does not allow float amounts
-        if not transaction_dto.asset.allow_float_amount:
-            fixed_amount = int(self.fixed_amount)
-        else:
+        # Use the integer amount if asset does not allow float amounts
+        if transaction_dto.asset.allow_float_amount:
             fixed_amount = self.fixed_amount
+        else:
+            fixed_amount = self._whole_fixed_amount
 
         # Compute asset amount based on transaction type
-        if transaction_dto.transaction_type == TransactionEnum.BUY:
-            wallet_currency_amount = self.wallet.amounts[self.wallet.base_currency]
-            currency_amount = min(wallet_currency_amount, fixed_amount)
-            asset_amount = currency_amount / transaction_dto.asset_price
-
-        elif transaction_dto.transaction_type == TransactionEnum.SELL:
-            wallet_asset_amount = self.wallet.amounts[transaction_dto.asset]
-            asset_amount = min(wallet_asset_amount, fixed_amount)
-
-        else:
-            asset_amount = 0
+        amount_function = self._amount_functions[transaction_dto.transaction_type.value]
+        asset_amount = amount_function(transaction_dto, fixed_amount)
 
         transaction_dto.asset_amount = asset_amount
         return transaction_dto